@@ -2,6 +2,7 @@ import codecs
 import errno
 import locale
 import os
+import select
 import signal
 import struct
 import sys
@@ -962,7 +963,15 @@ class Runner:
 
         .. versionadded:: 1.0
         """
-        return env if replace_env else dict(os.environ, **env)
+        if replace_env:
+            return env
+        # NOTE: dict(os.environ, **env) reads nicer but funnels the overrides
+        # through kwargs machinery; copy-then-update skips that, and skips the
+        # update entirely for the common no-overrides case.
+        merged = dict(os.environ)
+        if env:
+            merged.update(env)
+        return merged
 
     def should_use_pty(self, pty: bool, fallback: bool) -> bool:
         """
@@ -1241,6 +1250,8 @@ class Local(Runner):
         super().__init__(context)
         # Bookkeeping var for pty use case
         self.status = 0
+        # Child pidfd, held only while wait() blocks on it (Linux 5.3+)
+        self._pidfd: Optional[int] = None
 
     def should_use_pty(self, pty: bool = False, fallback: bool = True) -> bool:
         use_pty = False
@@ -1360,6 +1371,18 @@ class Local(Runner):
             )
 
     def kill(self) -> None:
+        # Prefer signaling via the pidfd wait() is blocked on, when present:
+        # it can't suffer pid-reuse races, however unlikely those are here.
+        pidfd = self._pidfd
+        sender = getattr(os, "pidfd_send_signal", None)
+        if pidfd is not None and sender is not None:
+            try:
+                sender(pidfd, signal.SIGKILL)
+                return
+            except OSError:
+                # pidfd already closed or child gone; the classic path below
+                # has its own already-dead handling.
+                pass
         pid = self.pid if self.using_pty else self.process.pid
         try:
             os.kill(pid, signal.SIGKILL)
@@ -1368,6 +1391,34 @@ class Local(Runner):
             # throw this upwards.
             pass
 
+    def wait(self) -> None:
+        # Generic Runner.wait busy-polls process_is_finished with a short
+        # sleep; when the platform offers pidfd_open (Linux 5.3+) we can
+        # instead block on the child's pidfd and wake the instant it exits.
+        # We still use a bounded poll timeout (reusing the input_sleep knob)
+        # so dead IO threads get noticed about as quickly as before.
+        if self.process_is_finished or self.has_dead_threads:
+            return
+        try:
+            pid = self.pid if self.using_pty else self.process.pid
+            pidfd = self._pidfd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            # No pidfd support (non-Linux, old kernel) or the child went away
+            # already; the sleep loop handles both just fine.
+            return super().wait()
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            while True:
+                # POLLIN fires on child exit; process_is_finished then reaps
+                # it. A timeout just means "go check the IO threads".
+                poller.poll(self.input_sleep * 1000)
+                if self.process_is_finished or self.has_dead_threads:
+                    return
+        finally:
+            self._pidfd = None
+            os.close(pidfd)
+
     @property
     def process_is_finished(self) -> bool:
         if self.using_pty:
@@ -1582,7 +1633,18 @@ class Result:
         # TODO: preserve alternate line endings? Mehhhh
         # NOTE: no trailing \n preservation; easier for below display if
         # normalized
-        return "\n\n" + "\n".join(getattr(self, stream).splitlines()[-count:])
+        # NOTE: rsplit walks only the tail of the buffer, where splitlines()
+        # would allocate a list holding every line of potentially-huge output.
+        text = getattr(self, stream)
+        if text.endswith("\n"):
+            text = text[:-1]
+        # CRLF-terminated streams (eg pty output on POSIX) leave a \r on each
+        # line after splitting on \n; drop those like splitlines() did.
+        lines = [
+            line[:-1] if line.endswith("\r") else line
+            for line in text.rsplit("\n", count)[-count:]
+        ]
+        return "\n\n" + "\n".join(lines)
 
 
 class Promise(Result):